@@ -1,9 +1,11 @@
 from fastmcp import FastMCP
 from typing import Union
-import re
+import math
+import time
 import structlog
 from pydantic import BaseModel
 from utils.http_client import api_client
+from utils.cache import TTLCache
 from models.auth_model import (
     SignInRequest,
     SignInResponse,
@@ -21,16 +23,53 @@ from models.auth_model import (
 
 logger = structlog.get_logger()
 
+# Separators dropped from phone input; whitespace is matched with
+# str.isspace() so NBSP and other Unicode spaces are stripped too
+_PHONE_SEPARATORS = frozenset("()-")
+
+
+def _strip_phone_separators(phone: str) -> str:
+    return "".join(ch for ch in phone if not ch.isspace() and ch not in _PHONE_SEPARATORS)
+
+# Local token bucket for OTP tools: 3 attempts per minute per (tool, user_id),
+# so calls the backend would reject anyway never leave the process
+OTP_BUCKET_CAPACITY = 3.0
+OTP_REFILL_PER_SECOND = 3.0 / 60.0
+OTP_BUCKET_MAX_KEYS = 10_000
+# A bucket idle this long has refilled completely, so letting it expire is
+# the same as keeping it; when full, the least recently used bucket goes
+_otp_buckets = TTLCache(
+    maxsize=OTP_BUCKET_MAX_KEYS, ttl=OTP_BUCKET_CAPACITY / OTP_REFILL_PER_SECOND
+)
+
+
+def _consume_otp_token(tool_name: str, user_id: str) -> None:
+    """Take one token from the caller's bucket or raise ValueError with the wait time"""
+    now = time.monotonic()
+    key = (tool_name, user_id)
+    last_refill, tokens = _otp_buckets.get(key) or (now, OTP_BUCKET_CAPACITY)
+    tokens = min(OTP_BUCKET_CAPACITY, tokens + (now - last_refill) * OTP_REFILL_PER_SECOND)
+
+    if tokens < 1:
+        _otp_buckets.set(key, (now, tokens))
+        wait_seconds = math.ceil((1 - tokens) / OTP_REFILL_PER_SECOND)
+        raise ValueError(f"Too many OTP attempts. Please wait {wait_seconds}s before trying again.")
+
+    _otp_buckets.set(key, (now, tokens - 1))
+
 
 class AuthAgent:
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
+        self.log = logger.bind(agent="auth")
         self.register_tools()
 
     def register_tools(self):
         # -------------------------
         # Sign In Tool
         # -------------------------
+        sign_in_log = self.log.bind(tool="sign_in")
+
         @self.mcp.tool()
         async def sign_in(
             phone: str,
@@ -64,18 +103,19 @@ class AuthAgent:
                     raise ValueError("longitude must be between -180 and 180.")
 
                 # Process phone number
-                raw_phone = phone.strip()
-                raw_phone = re.sub(r"[()\-\s]", "", raw_phone)
+                raw_phone = _strip_phone_separators(phone)
 
                 # Case: starts with +<countrycode><number>
                 if raw_phone.startswith("+"):
-                    match = re.match(r"^(\+\d{1,3})(\d+)$", raw_phone)
-                    if not match:
+                    digits = raw_phone[1:]
+                    if len(digits) < 2 or not digits.isdigit():
                         raise ValueError(
                             "Invalid phone format. Expected '+<code><number>'."
                         )
-                    country_code = match.group(1)
-                    raw_phone = match.group(2)
+                    # Up to 3 code digits, leaving at least one for the number
+                    code_length = min(3, len(digits) - 1)
+                    country_code = "+" + digits[:code_length]
+                    raw_phone = digits[code_length:]
 
                 # Case: starts with 0 (strip leading zeros)
                 elif raw_phone.startswith("0"):
@@ -119,8 +159,7 @@ class AuthAgent:
                     by_alias=True, exclude={"latitude", "longitude"}
                 )
 
-                logger.debug("sign_in payload built", payload=payload)
-                print("payload", payload)  # debug log
+                sign_in_log.debug("sign_in payload built", payload=payload)
 
                 # Make API request
                 result = await api_client.request(
@@ -130,21 +169,18 @@ class AuthAgent:
                 # Validate response structure and create proper response model
                 try:
                     validated_response = SignInResponse.model_validate(result)
-                    logger.info(
+                    sign_in_log.info(
                         "Sign in successful",
                         phone=phone,
                         country_code=country_code,
                         user_id=validated_response.user.mongo_id or validated_response.user.id,
                     )
 
-                    return SignInResponse(
-                        message=validated_response.message,
-                        user=validated_response.user,
-                        success=validated_response.success,
-                    )
+                    # Already validated; rebuilding it would validate twice
+                    return validated_response
 
                 except Exception as validation_error:
-                    logger.warning(
+                    sign_in_log.warning(
                         "Response validation failed but attempting to create response",
                         error=str(validation_error),
                         response=result,
@@ -163,7 +199,7 @@ class AuthAgent:
                     )
 
             except Exception as e:
-                logger.error("Sign in failed", error=str(e), phone=phone)
+                sign_in_log.error("Sign in failed", error=str(e), phone=phone)
                 return SignInErrorResponse(
                     error=str(e),
                     payload=sign_in_request,  # This will be None if validation failed before creation
@@ -172,6 +208,8 @@ class AuthAgent:
         # -------------------------
         # Verify OTP Tool
         # -------------------------
+        verify_otp_log = self.log.bind(tool="verify_otp")
+
         @self.mcp.tool()
         async def verify_otp(
             otp_code: str, user_id: str,
@@ -201,13 +239,15 @@ class AuthAgent:
                 if not otp_code.isdigit():
                     raise ValueError("otp_code must contain only digits.")
 
+                _consume_otp_token("verify_otp", user_id)
+
                 # Create request payload using Pydantic model for validation
                 verify_otp_request = VerifyOtpRequest(id=user_id, otp=otp_code)
 
                 # Convert to dict for API call
                 payload = verify_otp_request.model_dump()
 
-                print(" verify_otp payload", payload)  # debug log
+                verify_otp_log.debug("verify_otp payload built", user_id=user_id)
 
                 # Make API request
                 result = await api_client.request(
@@ -218,7 +258,7 @@ class AuthAgent:
                 try:
                     validated_response = VerifyOtpResponse.model_validate(result)
 
-                    logger.info(
+                    verify_otp_log.info(
                         "OTP verification successful",
                         user_id=user_id,
                         user_name=validated_response.user.name,
@@ -227,7 +267,7 @@ class AuthAgent:
                     return validated_response
 
                 except Exception as validation_error:
-                    logger.warning(
+                    verify_otp_log.warning(
                         "Response validation failed but attempting to create response",
                         error=str(validation_error),
                         response=result,
@@ -249,12 +289,14 @@ class AuthAgent:
                     )
 
             except Exception as e:
-                logger.error("OTP verification failed", error=str(e), user_id=user_id)
+                verify_otp_log.error("OTP verification failed", error=str(e), user_id=user_id)
                 return VerifyOtpErrorResponse(error=str(e), payload=verify_otp_request)
 
         # -------------------------
         # Resend OTP Tool
         # -------------------------
+        resend_otp_log = self.log.bind(tool="resend_otp")
+
         @self.mcp.tool()
         async def resend_otp(
             user_id: str,
@@ -280,6 +322,8 @@ class AuthAgent:
                         "user_id looks like a phone number. Please provide valid user_id from sign_in."
                     )
 
+                _consume_otp_token("resend_otp", user_id)
+
                 # Create request payload using Pydantic model for validation
                 resend_otp_request = ResendOtpRequest(userid=user_id)
 
@@ -294,7 +338,7 @@ class AuthAgent:
                 # Validate response structure and create proper response model
                 try:
                     validated_response = ResendOtpResponse.model_validate(result)
-                    logger.info(
+                    resend_otp_log.info(
                         "OTP resent successfully",
                         user_id=user_id,
                         message=validated_response.message,
@@ -303,7 +347,7 @@ class AuthAgent:
                     return validated_response
 
                 except Exception as validation_error:
-                    logger.warning(
+                    resend_otp_log.warning(
                         "Response validation failed but attempting to create response",
                         error=str(validation_error),
                         response=result,
@@ -315,5 +359,5 @@ class AuthAgent:
                     )
 
             except Exception as e:
-                logger.error("OTP resend failed", error=str(e), user_id=user_id)
+                resend_otp_log.error("OTP resend failed", error=str(e), user_id=user_id)
                 return ResendOtpErrorResponse(error=str(e), payload=resend_otp_request)
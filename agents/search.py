@@ -1,20 +1,86 @@
 from fastmcp import FastMCP
-from typing import Optional, Dict, Any, Annotated
+from typing import Optional, Dict, Any, Annotated, List
 import structlog
 from utils.http_client import api_client
-from models.search_model import Provider, SearchNearMeResponse
+from models.search_model import SearchNearMeResponse
 from utils.helper import compute_feedback_rating
+from utils.cache import TTLCache
+from config.settings import settings
 from pydantic import Field
 
 logger = structlog.get_logger()
 
+# Normalized providers for recent searches; TTL is short because providers move
+_search_cache = TTLCache(
+    maxsize=settings.SEARCH_CACHE_SIZE, ttl=settings.SEARCH_CACHE_TTL
+)
+
+# Shape of a failed search response; copied per failure instead of building
+# and dumping a SearchNearMeResponse
+_ERROR_RESPONSE_TEMPLATE: Dict[str, Any] = {
+    "providers": None,
+    "total_count": 0,
+    "search_radius": None,
+    "search_location": None,
+    "error": None,
+}
+
+
+def _search_response(
+    providers: List[Dict[str, Any]], radius: int, latitude: float, longitude: float
+) -> Dict[str, Any]:
+    """JSON-safe search response; SearchNearMeResponse is only the tool schema"""
+    return {
+        "providers": providers,
+        "total_count": len(providers),
+        "search_radius": float(radius),
+        "search_location": {
+            "latitude": float(latitude),
+            "longitude": float(longitude),
+        },
+    }
+
+
+def _build_matching(provider_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a Provider-shaped dict from a matchingWhistles entry"""
+    item = provider_data["item"]
+    location = item.get("location") or {}
+    coordinates = location.get("coordinates") or (0.0, 0.0)
+    return {
+        "id": item.get("_id", ""),
+        "name": item.get("name", ""),
+        "phone": f"{item.get('countryCode', '')} {item.get('phone', '')}",
+        "address": location.get("address", ""),
+        "distance": round(float(item.get("dis", 0.0)), 1),
+        "latitude": float(coordinates[1]),
+        "longitude": float(coordinates[0]),
+        "rating": compute_feedback_rating(item),
+    }
+
+
+def _build_direct(provider_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a Provider-shaped dict from a direct provider entry"""
+    return {
+        "id": provider_data.get("id", str(provider_data.get("_id", ""))),
+        "name": provider_data.get("name", provider_data.get("title", "")),
+        "phone": f"{provider_data.get('countryCode', '')} {provider_data.get('phone', '')}",
+        "address": provider_data.get("address", provider_data.get("location", "")),
+        "distance": round(float(provider_data.get("distance", 0.0)), 1),
+        "latitude": float(provider_data.get("latitude", provider_data.get("lat", 0.0))),
+        "longitude": float(provider_data.get("longitude", provider_data.get("lng", 0.0))),
+        "rating": compute_feedback_rating(provider_data),
+    }
+
 
 class SearchAgent:
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
+        self.log = logger.bind(agent="search")
         self.register_tools()
 
     def register_tools(self):
+        search_businesses_log = self.log.bind(tool="search_businesses")
+
         @self.mcp.tool()
         async def search_businesses(
             latitude: Annotated[
@@ -62,7 +128,19 @@ class SearchAgent:
             try:
                 # Ensure the keyword is a single value
                 keyword = self._sanitize_keyword(keyword)
-                print("keyword", keyword)
+
+                # ~100 m of coordinate jitter collapses onto one cache entry
+                cache_key = (
+                    round(latitude, 3),
+                    round(longitude, 3),
+                    radius,
+                    keyword or "",
+                    limit,
+                )
+                providers = _search_cache.get(cache_key)
+                if providers is not None:
+                    search_businesses_log.debug("Search served from cache", query=keyword)
+                    return _search_response(providers, radius, latitude, longitude)
 
                 payload = {
                     "keyword": keyword
@@ -80,57 +158,39 @@ class SearchAgent:
                     data=payload,
                 )
 
-                logger.info(
+                providers = self._normalize_providers(result)
+                results_count = len(providers)
+                _search_cache.set(cache_key, providers)
+
+                search_businesses_log.info(
                     "Search completed",
                     query=keyword,
-                    results_count=len(result.get("results", [])),
+                    results_count=results_count,
                 )
 
-                providers = self._normalize_providers(result)
-                print("providers", providers)
-
-                response = SearchNearMeResponse(
-                    providers=providers,
-                    total_count=len(providers),
-                    search_radius=radius,
-                    search_location={
-                        "latitude": latitude,
-                        "longitude": longitude,
-                    },
-                )
-
-                # ✅ Always return JSON-safe dict
-                return response.model_dump()
+                return _search_response(providers, radius, latitude, longitude)
 
             except Exception as e:
-                logger.error("Search failed", error=str(e))
-
-                error_response = SearchNearMeResponse(
-                    providers=[],
-                    total_count=0,
-                    search_radius=radius,
-                    search_location={
-                        "latitude": latitude,
-                        "longitude": longitude,
-                    },
-                )
-
+                search_businesses_log.error("Search failed", error=str(e))
+
+                resp = _ERROR_RESPONSE_TEMPLATE.copy()
+                resp["providers"] = []
+                resp["search_radius"] = float(radius)
+                resp["search_location"] = {
+                    "latitude": float(latitude),
+                    "longitude": float(longitude),
+                }
                 # ✅ Include error info in JSON response
-                resp = error_response.model_dump()
-                resp["error"] = f"Unexpected error: {str(e)}"
+                resp["error"] = f"Unexpected error: {e!s}"
                 return resp
 
     def _normalize_providers(self, result):
-        providers = []
-        data = result
-        providers_data = self._extract_providers_data(data)
-        for provider_data in providers_data:
-            if "item" in provider_data:  # matchingWhistles format
-                provider = self._normalize_matching_whistle(provider_data["item"])
-            else:  # direct provider format
-                provider = self._normalize_direct_provider(provider_data)
-            providers.append(provider)
-        return providers
+        # Shape is decided per record so mixed lists are parsed correctly
+        return [
+            _build_matching(provider_data) if "item" in provider_data
+            else _build_direct(provider_data)
+            for provider_data in self._extract_providers_data(result)
+        ]
 
     def _extract_providers_data(self, data):
         if isinstance(data, dict):
@@ -143,42 +203,10 @@ class SearchAgent:
             providers_data = []
         return providers_data
 
-    def _normalize_matching_whistle(self, item):
-        return Provider(
-            id=item.get("_id", ""),
-            name=item.get("name", ""),
-            phone=f"{item.get('countryCode', '')} {item.get('phone', '')}",
-            address=item.get("location", {}).get("address", ""),
-            distance=round(item.get("dis", 0.0), 1),
-            latitude=(
-                item.get("location", {}).get("coordinates", [0, 0])[1]
-                if item.get("location", {}).get("coordinates")
-                else 0.0
-            ),
-            longitude=(
-                item.get("location", {}).get("coordinates", [0, 0])[0]
-                if item.get("location", {}).get("coordinates")
-                else 0.0
-            ),
-            rating=compute_feedback_rating(item),
-        )
-
-    def _normalize_direct_provider(self, provider_data):
-        return Provider(
-            id=provider_data.get("id", str(provider_data.get("_id", ""))),
-            name=provider_data.get("name", provider_data.get("title", "")),
-            phone=f"{provider_data.get('countryCode', '')} {provider_data.get('phone', '')}",
-            address=provider_data.get("address", provider_data.get("location", "")),
-            distance=round(provider_data.get("distance", 0.0), 1),
-            latitude=provider_data.get("latitude", provider_data.get("lat", 0.0)),
-            longitude=provider_data.get("longitude", provider_data.get("lng", 0.0)),
-            rating=compute_feedback_rating(provider_data),
-        )
-
     def _sanitize_keyword(self, keyword: str) -> str:
         """Sanitize and ensure the keyword is a single value"""
         if "|" in keyword:
-            logger.warning(
+            self.log.warning(
                 "Multiple keywords detected, only the first one will be used."
             )
             # Split and take the first value, ensuring it's a single clean value
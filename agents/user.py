@@ -1,123 +1,207 @@
 # agents/user.py
 from fastmcp import FastMCP
-from typing import Annotated, Literal
+from typing import Annotated, Any, Callable, Dict, List, Literal
 import structlog
 from utils.http_client import api_client
+from utils.cache import TTLCache, token_key
+from config.settings import settings
 from pydantic import Field
-from models.user_model import UserProfileResponse, UserProfile
+from models.user_model import Quarantine, Reachability, UserProfileResponse, UserProfile
 
-logger = structlog.get_logger()
+# Short-lived cache of GET /user results, keyed by token digest
+_profile_cache = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE, ttl=settings.PROFILE_CACHE_TTL
+)
+
+# Bumped by toggle_visibility so a GET /user that was already in flight when
+# the profile changed doesn't overwrite the fresh entry with the old profile
+_profile_generation = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE, ttl=settings.PROFILE_CACHE_TTL * 10
+)
+
+
+# Payload keys of UserProfile's required (all str) fields
+_REQUIRED_PROFILE_KEYS = tuple(
+    field.alias or name
+    for name, field in UserProfile.model_fields.items()
+    if field.is_required()
+)
+
+
+def _build_profile(user_data: Dict[str, Any]) -> UserProfile:
+    """
+    Build a UserProfile from a /user payload.
+    Validation is skipped for well-formed payloads unless VALIDATE_API_RESPONSES
+    is set; one missing or non-string required field falls back to full
+    validation, so a broken payload fails instead of being returned and cached.
+    """
+    if settings.VALIDATE_API_RESPONSES or not all(
+        isinstance(user_data.get(key), str) for key in _REQUIRED_PROFILE_KEYS
+    ):
+        return UserProfile.model_validate(user_data)
+
+    # model_construct leaves nested dicts as-is, so build those explicitly
+    user_data = dict(user_data)
+    reachability = user_data.get("reachability")
+    if isinstance(reachability, dict):
+        user_data["reachability"] = Reachability.model_construct(**reachability)
+    quarantine = user_data.get("quarantine")
+    if isinstance(quarantine, dict):
+        user_data["quarantine"] = Quarantine.model_construct(**quarantine)
+    return UserProfile.model_construct(**user_data)
+
+
+# Failure responses carry no per-call data, so one instance is shared
+_FAILURE_RESPONSE = UserProfileResponse.model_construct(success=False, data=None)
+
+
+# toggle_visibility only ever sends one of two bodies, so encode them once
+_VISIBILITY_PAYLOADS = {
+    "true": b'{"visible":true}',
+    "false": b'{"visible":false}',
+}
+
+
+# Shared parameter types, so pydantic builds their field metadata once
+AccessToken = Annotated[
+    str, Field(description="User authentication token from sign_in or verify_otp")
+]
+BoolStr = Annotated[
+    Literal["true", "false"],
+    Field(description="Whether the user should be visible ('true') or hidden ('false')"),
+]
+
+
+# Tool coroutines are defined once at import and registered on each FastMCP
+# instance by UserAgent
+_TOOLS: List[Callable] = []
+
+
+def _tool(fn: Callable) -> Callable:
+    _TOOLS.append(fn)
+    return fn
+
+
+toggle_visibility_log = structlog.get_logger(agent="user", tool="toggle_visibility")
+
+
+@_tool
+async def toggle_visibility(
+    access_token: AccessToken,
+    visible: BoolStr,
+) -> UserProfileResponse:
+    """
+    Toggle user visibility status.
+
+    This function updates the user's visibility setting on the backend.  
+    If `visible` is `"true"`, the user becomes publicly visible.  
+    If `visible` is `"false"`, the user is hidden.
+
+    Args:
+        access_token (str): User authentication token obtained from sign_in or verify_otp.
+        visible (Literal["true", "false"]): Whether the user should be visible ("true") or hidden ("false").
+
+    Returns:
+        UserProfileResponse: Success flag and updated user profile data if successful.
+    """
+    try:
+        payload = _VISIBILITY_PAYLOADS[visible]
+
+        toggle_visibility_log.debug("toggle_visibility payload selected", visible=visible)
+
+        result = await api_client.request(
+            method="PUT",
+            endpoint="/user",
+            content=payload,
+            headers={"Authorization": access_token}
+        )
+
+        cache_key = token_key(access_token)
+        _profile_generation.set(cache_key, (_profile_generation.get(cache_key) or 0) + 1)
+        _profile_cache.pop(cache_key)
+        toggle_visibility_log.info("Visibility toggle successful", visible=visible)
+
+        if "user" not in result:
+            return _FAILURE_RESPONSE
+
+        user_data = result["user"]
+        validated_response = _build_profile(user_data)
+
+        # The PUT echoes the updated user, so a follow-up get_user_profile
+        # can be served without another round trip
+        response = UserProfileResponse(success=True, data=validated_response)
+        _profile_cache.set(cache_key, response)
+        return response
+
+    except Exception as e:
+        toggle_visibility_log.error(
+            "Visibility toggle failed",
+            error=str(e),
+            visible=visible
+        )
+        return _FAILURE_RESPONSE
+
+
+get_user_profile_log = structlog.get_logger(agent="user", tool="get_user_profile")
+
+
+@_tool
+async def get_user_profile(
+    access_token: AccessToken,
+) -> UserProfileResponse:
+    """
+    Retrieve the user profile details.
+
+    This function fetches the user's profile information from the backend,  
+    including whistles and visibility status.
+
+    Args:
+        access_token (str): User authentication token obtained from sign_in or verify_otp.
+
+    Returns:
+        UserProfileResponse: Success flag and user profile data if retrieval succeeds.
+    """
+    cache_key = token_key(access_token)
+    cached = _profile_cache.get(cache_key)
+    if cached is not None:
+        get_user_profile_log.debug("User profile served from cache")
+        return cached
+
+    generation = _profile_generation.get(cache_key)
+    try:
+        result = await api_client.request(
+            method="GET",
+            endpoint="/user",
+            headers={"Authorization": access_token}
+        )
+
+        if "user" not in result:
+            return _FAILURE_RESPONSE
+
+        user_data = result["user"]
+        validated_response = _build_profile(user_data)
+
+        get_user_profile_log.info(
+            "User profile retrieved successfully",
+            user_id=validated_response.id
+        )
+
+        response = UserProfileResponse(success=True, data=validated_response)
+        # Skip the write if the profile changed while this GET was in flight
+        if _profile_generation.get(cache_key) == generation:
+            _profile_cache.set(cache_key, response)
+        return response
+
+    except Exception as e:
+        get_user_profile_log.error("User profile retrieval failed", error=str(e))
+        return _FAILURE_RESPONSE
 
 
 class UserAgent:
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
         self.register_tools()
-    
+
     def register_tools(self):
-        @self.mcp.tool()
-        async def toggle_visibility(
-            access_token: Annotated[
-                str, Field(description="User authentication token from sign_in or verify_otp")
-            ],
-            visible: Annotated[
-                Literal["true", "false"],
-                Field(description="Whether the user should be visible ('true') or hidden ('false')")
-            ],
-        ) -> UserProfileResponse:
-            """
-            Toggle user visibility status.
-
-            This function updates the user's visibility setting on the backend.  
-            If `visible` is `"true"`, the user becomes publicly visible.  
-            If `visible` is `"false"`, the user is hidden.
-
-            Args:
-                access_token (str): User authentication token obtained from sign_in or verify_otp.
-                visible (Literal["true", "false"]): Whether the user should be visible ("true") or hidden ("false").
-
-            Returns:
-                UserProfileResponse: Success flag and updated user profile data if successful.
-            """
-            try:
-                # Convert to boolean for API call
-                visible_bool = visible == "true"
-                payload = {"visible": visible_bool}
-
-                print("toggle_visibility payload:", payload)  # debug log
-
-                result = await api_client.request(
-                    method="PUT",
-                    endpoint="/user",
-                    data=payload,
-                    headers={"Authorization": access_token}
-                )
-
-                logger.info("Visibility toggle successful", visible=visible)
-
-                if "user" not in result:
-                    return UserProfileResponse(success=False, data=None)  # type: ignore
-
-                user_data = result["user"]
-                validated_response = UserProfile.model_validate(user_data)
-
-                return UserProfileResponse(success=True, data=validated_response)
-
-            except Exception as e:
-                logger.error(
-                    "Visibility toggle failed",
-                    error=str(e),
-                    visible=visible
-                )
-                return UserProfileResponse(
-                    success=False,
-                    message="An unexpected error occurred while toggling visibility. Please try again later."
-                )  # type: ignore
-
-        @self.mcp.tool()
-        async def get_user_profile(
-            access_token: Annotated[
-                str, Field(description="User authentication token from sign_in or verify_otp")
-            ]
-        ) -> UserProfileResponse:
-            """
-            Retrieve the user profile details.
-
-            This function fetches the user's profile information from the backend,  
-            including whistles and visibility status.
-
-            Args:
-                access_token (str): User authentication token obtained from sign_in or verify_otp.
-
-            Returns:
-                UserProfileResponse: Success flag and user profile data if retrieval succeeds.
-            """
-            try:
-                result = await api_client.request(
-                    method="GET",
-                    endpoint="/user",
-                    headers={"Authorization": access_token}
-                )
-
-                if "user" not in result:
-                    return UserProfileResponse(success=False, data=None)  # type: ignore
-
-                user_data = result["user"]
-                validated_response = UserProfile.model_validate(user_data)
-
-                # debug log
-                print(f"get_user_profile response: {validated_response}")
-
-                logger.info(
-                    "User profile retrieved successfully",
-                    user_id=validated_response.id
-                )
-
-                return UserProfileResponse(success=True, data=validated_response)
-
-            except Exception as e:
-                logger.error("User profile retrieval failed", error=str(e))
-                return UserProfileResponse(
-                    success=False,
-                    message="An unexpected error occurred while retrieving the profile. Please try again later."
-                )  # type: ignore
+        for fn in _TOOLS:
+            self.mcp.tool()(fn)
@@ -1,22 +1,173 @@
 from fastmcp import FastMCP
-from typing import Dict, Any, Optional, List, Annotated, Union
+from typing import Dict, Any, Optional, List, Annotated, Tuple, TypedDict, Union
 import structlog
 from datetime import datetime, timedelta
 import json
 import asyncio
+import hashlib
 import os
+import re
 from dataclasses import dataclass
 from enum import Enum
 from openai import AsyncOpenAI
 from pydantic import Field, BaseModel, ValidationError
 from utils.http_client import api_client
+from utils.cache import TTLCache, token_key
+from config.settings import settings
 
 logger = structlog.get_logger()
 
+# Backend error markers in precedence order (ETLIMIT wins over referral);
+# anchored lookaheads keep that order regardless of position in the message
+_ERROR_RE = re.compile(
+    r"(?s)(?=.*?(?P<etlimit>ETLIMIT))|(?=.*?(?P<referral>(?i:referral)))"
+)
+
+
+def _classify_error(error_msg: str) -> Optional[str]:
+    match = _ERROR_RE.match(error_msg)
+    return match.lastgroup if match else None
+
+# create_whistles_bulk input cap and how many items are processed at once
+MAX_BULK_WHISTLES = 20
+BULK_CREATE_CONCURRENCY = 5
+
+
+# Shared default for read-only list fields; serializes as [] like a list would
+_EMPTY: Tuple[Any, ...] = ()
+
+
+def _format_whistle(whistle: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a backend whistle into the shape returned by the tools"""
+    return {
+        "id": whistle.get("_id") or whistle.get("id"),
+        "description": whistle.get("description", ""),
+        "tags": whistle.get("tags", _EMPTY),
+        "alertRadius": whistle.get("alertRadius", 2),
+        "expiry": whistle.get("expiry", "never"),
+        "provider": whistle.get("provider", False),
+        "active": whistle.get("active", True),
+    }
+
+
+# Recent GET /user results for list_whistles, keyed by token digest; shares
+# the profile cache's TTL since both read the same endpoint
+_user_cache = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE, ttl=settings.PROFILE_CACHE_TTL
+)
+
+
+# (ETag, body) of the last GET /user per token, kept well past the TTL so an
+# expired entry can be revalidated with If-None-Match instead of refetched
+_user_validators = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE, ttl=settings.PROFILE_CACHE_TTL * 10
+)
+
+# Concurrent cache misses for the same token share one in-flight GET /user
+_user_inflight: Dict[bytes, "asyncio.Task[Dict[str, Any]]"] = {}
+
+# Bumped by _invalidate_user so a GET /user that was already in flight when
+# the user's whistles changed doesn't cache its pre-change body afterwards
+_user_generation = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE, ttl=settings.PROFILE_CACHE_TTL * 10
+)
+
+
+async def _load_user(access_token: str, cache_key: bytes) -> Dict[str, Any]:
+    generation = _user_generation.get(cache_key)
+    validator = _user_validators.get(cache_key)
+    result, etag = await api_client.get_if_changed(
+        "/user",
+        etag=validator[0] if validator else None,
+        headers={"Authorization": access_token}
+    )
+    if result is None:  # 304 Not Modified
+        result = validator[1]
+    if _user_generation.get(cache_key) != generation:
+        # Invalidated while awaiting; the body may predate the change
+        return result
+    if etag:
+        _user_validators.set(cache_key, (etag, result))
+    else:
+        # A stale validator would pair an old ETag with a body we no longer hold
+        _user_validators.pop(cache_key)
+    _user_cache.set(cache_key, result)
+    return result
+
+
+def _invalidate_user(access_token: str) -> None:
+    cache_key = token_key(access_token)
+    _user_generation.set(cache_key, (_user_generation.get(cache_key) or 0) + 1)
+    _user_cache.pop(cache_key)
+    _user_validators.pop(cache_key)
+    # Later callers must not join a GET that started before the change
+    _user_inflight.pop(cache_key, None)
+
+
+async def _fetch_user(access_token: str) -> Dict[str, Any]:
+    """GET /user for a token, served from the short-lived cache when fresh"""
+    cache_key = token_key(access_token)
+    result = _user_cache.get(cache_key)
+    if result is not None:
+        return result
+
+    task = _user_inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_load_user(access_token, cache_key))
+        _user_inflight[cache_key] = task
+
+        def _forget(done: "asyncio.Task[Dict[str, Any]]") -> None:
+            # An invalidation may already have replaced this task
+            if _user_inflight.get(cache_key) is done:
+                del _user_inflight[cache_key]
+
+        task.add_done_callback(_forget)
+
+    # Shield so one cancelled caller doesn't abort the request for the others
+    return await asyncio.shield(task)
+
+
+# Successful create_whistle results by request digest, so a client retrying
+# after a timeout gets the whistle it already created instead of a duplicate
+_recent_creates = TTLCache(maxsize=1024, ttl=settings.CREATE_DEDUP_TTL)
+
+# Identical creates that are still running share one task
+_create_inflight: Dict[bytes, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def _create_key(
+    user_input: str,
+    access_token: str,
+    confidence_threshold: float,
+    force_create: bool
+) -> bytes:
+    raw = f"{access_token}\x00{user_input}\x00{confidence_threshold}\x00{force_create}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
 class ProcessingStatus(Enum):
     SUCCESS = "success"
     ERROR = "error"
     CLARIFICATION_NEEDED = "clarification_needed"
+    DUPLICATE = "duplicate"
+
+# Fixed error responses, shared instead of rebuilt on every failure
+_ERR_TAG_LIMIT = {
+    "status": ProcessingStatus.ERROR.value,
+    "message": "Too many tags specified (maximum 20 allowed)"
+}
+_ERR_NO_WHISTLE_RETURNED = {
+    "status": ProcessingStatus.ERROR.value,
+    "message": "Whistle creation failed - no whistle returned"
+}
+_ERR_CREATE_FAILED = {
+    "status": ProcessingStatus.ERROR.value,
+    "message": "An unexpected error occurred while creating the whistle. Please try again later."
+}
+_ERR_LIST_FAILED = {
+    "status": "error",
+    "message": "An unexpected error occurred while listing whistles. Please try again later.",
+    "whistles": _EMPTY
+}
 
 @dataclass
 class ExtractedWhistleData:
@@ -34,6 +185,14 @@ class ExtractedWhistleData:
         if self.tags is None:
             self.tags = []
 
+class WhistlePayload(TypedDict):
+    """Body of POST /whistle under the "whistle" key"""
+    description: str
+    alertRadius: int
+    tags: List[str]
+    provider: bool
+    expiry: str
+
 class AdvancedLLMExtractor:
     """Pure LLM-based extraction using OpenAI"""
     
@@ -58,7 +217,7 @@ class AdvancedLLMExtractor:
             return await self._extract_with_openai(user_input)
             
         except Exception as e:
-            logger.error(f"OpenAI extraction failed: {str(e)}")
+            logger.error("OpenAI extraction failed", error=str(e))
             return ExtractedWhistleData(
                 description=user_input,
                 ask_again=True,
@@ -222,10 +381,10 @@ Respond with valid JSON:
             return json.loads(content)
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse OpenAI JSON response: {content}")
+            logger.error("Failed to parse OpenAI JSON response", content=content)
             raise Exception(f"Invalid JSON response from OpenAI: {str(e)}")
         except Exception as e:
-            logger.error(f"OpenAI API call failed: {str(e)}")
+            logger.error("OpenAI API call failed", error=str(e))
             raise Exception(f"OpenAI API error: {str(e)}")
     
     def _create_extraction_result(self, user_input: str, llm_result: Dict[str, Any]) -> ExtractedWhistleData:
@@ -346,10 +505,10 @@ class WhistleValidator:
         # Validate expiry
         if data.expiry != "never":
             try:
-                expiry_dt = datetime.fromisoformat(data.expiry.replace('Z', '+00:00'))
+                expiry_dt = datetime.fromisoformat(data.expiry)
                 if expiry_dt <= datetime.now(expiry_dt.tzinfo):
                     errors.append("Expiry date is in the past")
-            except (ValueError, AttributeError):
+            except (ValueError, TypeError):
                 warnings.append("Expiry date format unclear - using default")
                 default_expiry = datetime.now() + timedelta(days=7)
                 data.expiry = default_expiry.isoformat() + "Z"
@@ -368,246 +527,397 @@ class WhistleAgent:
         self.mcp = mcp
         self.llm_extractor = AdvancedLLMExtractor()
         self.validator = WhistleValidator()
+        self.log = logger.bind(agent="whistle")
+        self.create_whistle_log = self.log.bind(tool="create_whistle")
+        self.create_whistles_bulk_log = self.log.bind(tool="create_whistles_bulk")
+        self.list_whistles_log = self.log.bind(tool="list_whistles")
         self.register_tools()
     
     def register_tools(self):
-        @self.mcp.tool()
-        async def create_whistle(
-            user_input: Annotated[
-                str, 
-                Field(
-                    description="""Natural language input describing any service request or offer.
-                    
-                    The system uses advanced AI to understand:
-                    - Any type of service, skill, or help needed/offered
-                    - Whether you're providing or seeking services
-                    - Location preferences and timing
-                    - Context and intent from conversational input
-                    
-                    Examples of what works:
-                    - "I need someone to fix my leaky faucet"
-                    - "Can teach piano lessons to beginners"
-                    - "Looking for a babysitter this weekend"
-                    - "Available for freelance graphic design work"
-                    - "Need help moving furniture tomorrow"
-                    - "Offering Spanish conversation practice"
-                    
-                    Just describe what you need or can offer naturally."""
-                )
-            ],
-            access_token: Annotated[
-                str,
-                Field(description="User authentication token", default="")
-            ] = "",
-            confidence_threshold: Annotated[
-                float,
-                Field(
-                    description="Minimum confidence score to proceed (0.0-1.0)",
-                    default=0.6,
-                    ge=0.0,
-                    le=1.0
-                )
-            ] = 0.6,
-            force_create: Annotated[
-                bool,
-                Field(
-                    description="Force creation even with low confidence",
-                    default=False
-                )
-            ] = False
-        ) -> Dict[str, Any]:
-            """
-            Create a whistle from any natural language input using advanced AI processing.
-            
-            This tool uses sophisticated language understanding to extract service information
-            from conversational input without relying on keywords or patterns.
-            
-            Returns:
-            - success: Whistle created successfully
-            - clarification_needed: More information required
-            - error: Creation failed
-            """
-            try:                
-                
-                # Extract attributes using OpenAI
-                extracted_data = await self.llm_extractor.extract_attributes(user_input)
-                
-                # Validate extracted data
-                validation_result = self.validator.validate_whistle_data(extracted_data)
-                
-                # Check confidence and validation
-                needs_clarification = (
-                    extracted_data.ask_again or 
-                    not validation_result["valid"] or 
-                    (extracted_data.confidence_score < confidence_threshold and not force_create)
-                )
-                
-                if needs_clarification:
-                    return {
-                        "status": ProcessingStatus.CLARIFICATION_NEEDED.value,
-                        "message": extracted_data.reason or "; ".join(validation_result["errors"]),
-                        "confidence_score": extracted_data.confidence_score,
-                        "extracted_data": {
-                            "description": extracted_data.description,
-                            "tags": extracted_data.tags,
-                            "provider": extracted_data.provider,
-                            "alertRadius": extracted_data.alert_radius,
-                            "expiry": extracted_data.expiry
-                        },
-                        "warnings": validation_result.get("warnings", []),
-                        "suggestions": self._generate_dynamic_suggestions(extracted_data, validation_result)
-                    }
-                
-                # Prepare whistle data for API
-                whistle_data = {
-                    "description": extracted_data.description,
-                    "alertRadius": extracted_data.alert_radius,
-                    "tags": extracted_data.tags,
-                    "provider": extracted_data.provider if extracted_data.provider is not None else False,
-                    "expiry": extracted_data.expiry
-                }
-                
-                logger.info("Creating whistle", whistle_data=whistle_data, confidence=extracted_data.confidence_score)
-                
-                print("whistle_data",whistle_data)
-                # Create whistle via API
-                result = await api_client.request(
-                    method="POST",
-                    endpoint="/whistle",
-                    data={"whistle": whistle_data},
-                    headers={"Authorization": access_token}
-                )
-                
-                # Process API response
-                new_whistle = result.get("newWhistle")
-                if not new_whistle:
-                    return {
-                        "status": ProcessingStatus.ERROR.value,
-                        "message": "Whistle creation failed - no whistle returned"
-                    }
-                
-                # Format response
-                formatted_whistle = {
-                    "id": new_whistle.get("_id") or new_whistle.get("id"),
-                    "description": new_whistle.get("description", ""),
-                    "tags": new_whistle.get("tags", []),
-                    "alertRadius": new_whistle.get("alertRadius", 2),
-                    "expiry": new_whistle.get("expiry", "never"),
-                    "provider": new_whistle.get("provider", False),
-                    "active": new_whistle.get("active", True),
-                }
-                
-                logger.info(
-                    "Whistle created successfully", 
-                    whistle_id=formatted_whistle["id"],
-                    provider=formatted_whistle["provider"],
-                    confidence=extracted_data.confidence_score
+        for tool in (self.create_whistle, self.create_whistles_bulk, self.list_whistles):
+            self.mcp.tool(tool)
+
+    async def create_whistle(
+        self,
+        user_input: Annotated[
+            str, 
+            Field(
+                description="""Natural language input describing any service request or offer.
+
+                The system uses advanced AI to understand:
+                - Any type of service, skill, or help needed/offered
+                - Whether you're providing or seeking services
+                - Location preferences and timing
+                - Context and intent from conversational input
+
+                Examples of what works:
+                - "I need someone to fix my leaky faucet"
+                - "Can teach piano lessons to beginners"
+                - "Looking for a babysitter this weekend"
+                - "Available for freelance graphic design work"
+                - "Need help moving furniture tomorrow"
+                - "Offering Spanish conversation practice"
+
+                Just describe what you need or can offer naturally."""
+            )
+        ],
+        access_token: Annotated[
+            str,
+            Field(description="User authentication token", default="")
+        ] = "",
+        confidence_threshold: Annotated[
+            float,
+            Field(
+                description="Minimum confidence score to proceed (0.0-1.0)",
+                default=0.6,
+                ge=0.0,
+                le=1.0
+            )
+        ] = 0.6,
+        force_create: Annotated[
+            bool,
+            Field(
+                description="Force creation even with low confidence",
+                default=False
+            )
+        ] = False
+    ) -> Dict[str, Any]:
+        """
+        Create a whistle from any natural language input using advanced AI processing.
+
+        This tool uses sophisticated language understanding to extract service information
+        from conversational input without relying on keywords or patterns.
+
+        Returns:
+        - success: Whistle created successfully
+        - clarification_needed: More information required
+        - error: Creation failed
+        """
+        return await self._create_whistle_once(
+            user_input, access_token, confidence_threshold, force_create
+        )
+
+    async def create_whistles_bulk(
+        self,
+        user_inputs: Annotated[
+            List[str],
+            Field(
+                description="""Several natural language whistle descriptions to create at once.
+                Each entry is processed exactly like the user_input of create_whistle.""",
+                min_length=1,
+                max_length=MAX_BULK_WHISTLES
+            )
+        ],
+        access_token: Annotated[
+            str,
+            Field(description="User authentication token", default="")
+        ] = "",
+        confidence_threshold: Annotated[
+            float,
+            Field(
+                description="Minimum confidence score to proceed (0.0-1.0)",
+                default=0.6,
+                ge=0.0,
+                le=1.0
+            )
+        ] = 0.6,
+        force_create: Annotated[
+            bool,
+            Field(
+                description="Force creation even with low confidence",
+                default=False
+            )
+        ] = False
+    ) -> Dict[str, Any]:
+        """
+        Create several whistles concurrently from natural language inputs.
+
+        Each input goes through the same AI extraction and validation as
+        create_whistle; results are returned in input order.
+
+        Identical inputs are created once; repeats get a "duplicate" result
+        pointing at the first occurrence.
+
+        Returns:
+        - results: One result per input
+        - created_count: Number of distinct whistles created
+        - duplicate_count: Number of inputs that repeated an earlier one
+        - failed_count: Number of inputs that errored or need clarification
+        """
+        # Index of the first occurrence of each distinct input
+        first_index: Dict[str, int] = {}
+        for index, user_input in enumerate(user_inputs):
+            first_index.setdefault(user_input, index)
+
+        # Each item makes several OpenAI calls, so bound the fan-out
+        semaphore = asyncio.Semaphore(BULK_CREATE_CONCURRENCY)
+
+        async def create_one(user_input: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._create_whistle_once(
+                    user_input, access_token, confidence_threshold, force_create
                 )
-                
+
+        created = dict(zip(
+            first_index,
+            await asyncio.gather(*(create_one(u) for u in first_index))
+        ))
+
+        results = []
+        for index, user_input in enumerate(user_inputs):
+            original = first_index[user_input]
+            if original == index:
+                results.append(created[user_input])
+            else:
+                results.append({
+                    "status": ProcessingStatus.DUPLICATE.value,
+                    "message": f"Same input as entry {original}; it is processed only once",
+                    "duplicate_of": original
+                })
+
+        # Distinct whistle ids; a whistle without an id counts on its own
+        created_count = len({
+            r["whistle"]["id"] or ("input", user_input)
+            for user_input, r in created.items()
+            if r["status"] == ProcessingStatus.SUCCESS.value
+        })
+        duplicate_count = len(user_inputs) - len(first_index)
+        failed_count = sum(
+            1 for r in created.values() if r["status"] != ProcessingStatus.SUCCESS.value
+        )
+
+        self.create_whistles_bulk_log.info(
+            "Bulk whistle creation finished",
+            requested=len(user_inputs),
+            created_count=created_count,
+            duplicate_count=duplicate_count
+        )
+
+        return {
+            "status": ProcessingStatus.SUCCESS.value if created_count else ProcessingStatus.ERROR.value,
+            "results": results,
+            "created_count": created_count,
+            "duplicate_count": duplicate_count,
+            "failed_count": failed_count
+        }
+
+    async def list_whistles(
+        self,
+        access_token: Annotated[
+            str, Field(description="User authentication token", default="")
+        ] = "",
+        active_only: Annotated[
+            bool,
+            Field(
+                description="If True, only return active whistles",
+                default=False
+            )
+        ] = False,
+        limit: Annotated[
+            int,
+            Field(
+                description="Maximum number of whistles to return (default 50); page with offset for more",
+                default=50,
+                ge=1,
+                le=1000
+            )
+        ] = 50,
+        offset: Annotated[
+            int,
+            Field(
+                description="Number of whistles to skip, for paging through results",
+                default=0,
+                ge=0
+            )
+        ] = 0
+    ) -> Dict[str, Any]:
+        """
+        Fetch whistles for the authenticated user, one page at a time.
+
+        At most `limit` whistles (50 by default) are returned per call, so a
+        user with more whistles gets a truncated list unless the caller keeps
+        requesting with a larger offset while has_more is True.
+
+        Args:
+            access_token: User authentication token
+            active_only: If True, only return active whistles
+            limit: Maximum number of whistles to return (default: 50, max: 1000)
+            offset: Number of whistles to skip; pass offset + limit to get the next page
+
+        Returns:
+            Dictionary with success status, the page of whistles, total_count and has_more
+        """
+        try:            
+           # Fetch user details from the 'user' endpoint
+            result = await _fetch_user(access_token)
+            user = result.get("user", {})
+            whistles = user.get("Whistles", _EMPTY)
+
+            if active_only:
+                # Count matches and keep only the page in one pass, without
+                # materializing the filtered list
+                total_count = 0
+                page = []
+                end = offset + limit
+                for w in whistles:
+                    if w.get("active", True):
+                        if offset <= total_count < end:
+                            page.append(w)
+                        total_count += 1
+            else:
+                total_count = len(whistles)
+                page = whistles[offset:offset + limit]
+
+            # Only the requested page is formatted
+            formatted_whistles = [_format_whistle(w) for w in page]
+
+            self.list_whistles_log.info(
+                "Whistles listed successfully",
+                total_count=total_count,
+                returned_count=len(formatted_whistles),
+                active_only=active_only
+            )
+
+            return {
+                "status": "success",
+                "whistles": formatted_whistles,
+                "total_count": total_count,
+                "has_more": offset + len(formatted_whistles) < total_count
+            }
+
+        except Exception as e:
+            error_msg = str(e)
+            self.list_whistles_log.error("Whistle listing failed", error=error_msg)
+
+            return _ERR_LIST_FAILED
+
+    async def _create_whistle_once(
+        self,
+        user_input: str,
+        access_token: str,
+        confidence_threshold: float,
+        force_create: bool
+    ) -> Dict[str, Any]:
+        """Run _create_whistle, collapsing repeats of the same request"""
+        key = _create_key(user_input, access_token, confidence_threshold, force_create)
+        result = _recent_creates.get(key)
+        if result is not None:
+            self.create_whistle_log.info("Duplicate create_whistle served from cache")
+            return result
+
+        task = _create_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._create_whistle(
+                user_input, access_token, confidence_threshold, force_create
+            ))
+            _create_inflight[key] = task
+            task.add_done_callback(lambda _: _create_inflight.pop(key, None))
+
+        result = await asyncio.shield(task)
+        # Only successes are remembered; errors and clarifications may change on retry
+        if result.get("status") == ProcessingStatus.SUCCESS.value:
+            _recent_creates.set(key, result)
+        return result
+
+    async def _create_whistle(
+        self,
+        user_input: str,
+        access_token: str,
+        confidence_threshold: float,
+        force_create: bool
+    ) -> Dict[str, Any]:
+        """Extract, validate and create one whistle; shared by the create tools"""
+        try:
+            # Extract attributes using OpenAI
+            extracted_data = await self.llm_extractor.extract_attributes(user_input)
+
+            # Validate extracted data
+            validation_result = self.validator.validate_whistle_data(extracted_data)
+
+            # Check confidence and validation
+            needs_clarification = (
+                extracted_data.ask_again or 
+                not validation_result["valid"] or 
+                (extracted_data.confidence_score < confidence_threshold and not force_create)
+            )
+
+            if needs_clarification:
                 return {
-                    "status": ProcessingStatus.SUCCESS.value,
-                    "whistle": formatted_whistle,
-                    "message": f"Whistle created successfully! {'Offering' if formatted_whistle['provider'] else 'Seeking'} {', '.join(formatted_whistle['tags'])}",
+                    "status": ProcessingStatus.CLARIFICATION_NEEDED.value,
+                    "message": extracted_data.reason or "; ".join(validation_result["errors"]),
                     "confidence_score": extracted_data.confidence_score,
+                    "extracted_data": {
+                        "description": extracted_data.description,
+                        "tags": extracted_data.tags,
+                        "provider": extracted_data.provider,
+                        "alertRadius": extracted_data.alert_radius,
+                        "expiry": extracted_data.expiry
+                    },
                     "warnings": validation_result.get("warnings", []),
-                    "matching_whistles": result.get("matchingWhistles", [])
+                    "suggestions": self._generate_dynamic_suggestions(extracted_data, validation_result)
                 }
-                
-            except Exception as e:
-                error_msg = str(e)
-                logger.error("Whistle creation failed", error=error_msg)
-                
-                # Handle specific API errors
-                if "ETLIMIT" in error_msg:
-                    return {
-                        "status": ProcessingStatus.ERROR.value,
-                        "message": "Too many tags specified (maximum 20 allowed)"
-                    }
-                elif "referral" in error_msg.lower():
-                    return {
-                        "status": ProcessingStatus.ERROR.value,
-                        "message": error_msg
-                    }
-                else:
-                    return {
-                        "status": ProcessingStatus.ERROR.value,
-                        "message": "An unexpected error occurred while creating the whistle. Please try again later."
-                    }
-    
-    
-        
-        @self.mcp.tool()
-        async def list_whistles(
-            access_token: Annotated[
-                str, Field(description="User authentication token", default="")
-            ] = "",
-            active_only: Annotated[
-                bool,
-                Field(
-                    description="If True, only return active whistles",
-                    default=False
-                )
-            ] = False
-        ) -> Dict[str, Any]:
-            """
-            Fetch all whistles for the authenticated user.
-
-            Args:
-                access_token: User authentication token
-                active_only: If True, only return active whistles
-
-            Returns:
-                Dictionary with success status and list of whistles
-            """
-            try:            
-               # Fetch user details from the 'user' endpoint
-                result = await api_client.request(
-                    method="GET",
-                    endpoint="/user",
-                    headers={"Authorization": access_token}
-                )
-                print("list_whistles result",result)
-                user = result.get("user", {})
-                whistles = user.get("Whistles", [])
-
-                # Apply active filter if requested
-                if active_only:
-                    whistles = [w for w in whistles if w.get("active", True)]
-
-                # Format whistles in a consistent manner
-                formatted_whistles = [
-                    {
-                        "id": w.get("id") or w.get("_id"),
-                        "description": w.get("description", ""),
-                        "tags": w.get("tags", []),
-                        "alertRadius": w.get("alertRadius", 2),
-                        "expiry": w.get("expiry", "never"),
-                        "provider": w.get("provider", False),
-                        "active": w.get("active", True),
-                    }
-                    for w in whistles
-                ]
 
-                logger.info(
-                    "Whistles listed successfully",
-                    total_count=len(formatted_whistles),
-                    active_only=active_only
-                )
+            # Prepare whistle data for API
+            whistle_data: WhistlePayload = {
+                "description": extracted_data.description,
+                "alertRadius": extracted_data.alert_radius,
+                "tags": extracted_data.tags,
+                "provider": extracted_data.provider if extracted_data.provider is not None else False,
+                "expiry": extracted_data.expiry
+            }
+
+            self.create_whistle_log.info("Creating whistle", whistle_data=whistle_data, confidence=extracted_data.confidence_score)
+
+            # Create whistle via API
+            result = await api_client.request(
+                method="POST",
+                endpoint="/whistle",
+                data={"whistle": whistle_data},
+                headers={"Authorization": access_token}
+            )
 
-                return {
-                    "status": "success",
-                    "whistles": formatted_whistles
-                }
+            # The user's whistle list changed; drop any cached GET /user
+            _invalidate_user(access_token)
 
-            except Exception as e:
-                error_msg = str(e)
-                logger.error("Whistle listing failed", error=error_msg)
+            # Process API response
+            new_whistle = result.get("newWhistle")
+            if not new_whistle:
+                return _ERR_NO_WHISTLE_RETURNED
 
-                return {
-                    "status": "error",
-                    "message": "An unexpected error occurred while creating the whistle. Please try again later.",
-                    "whistles": []
-                }
+            # Format response
+            formatted_whistle = _format_whistle(new_whistle)
+
+            self.create_whistle_log.info(
+                "Whistle created successfully", 
+                whistle_id=formatted_whistle["id"],
+                provider=formatted_whistle["provider"],
+                confidence=extracted_data.confidence_score
+            )
+
+            return {
+                "status": ProcessingStatus.SUCCESS.value,
+                "whistle": formatted_whistle,
+                "message": f"Whistle created successfully! {'Offering' if formatted_whistle['provider'] else 'Seeking'} {', '.join(formatted_whistle['tags'])}",
+                "confidence_score": extracted_data.confidence_score,
+                "warnings": validation_result.get("warnings", []),
+                "matching_whistles": result.get("matchingWhistles", _EMPTY)
+            }
+
+        except Exception as e:
+            error_msg = str(e)
+            self.create_whistle_log.error("Whistle creation failed", error=error_msg)
+
+            # Handle specific API errors
+            match _classify_error(error_msg):
+                case "etlimit":
+                    return _ERR_TAG_LIMIT
+                case "referral":
+                    return {
+                        "status": ProcessingStatus.ERROR.value,
+                        "message": error_msg
+                    }
+                case _:
+                    return _ERR_CREATE_FAILED
 
     def _generate_dynamic_suggestions(self, data: ExtractedWhistleData, validation_result: Dict[str, Any]) -> List[str]:
         """Generate contextual suggestions based on extraction results"""
@@ -1,40 +1,122 @@
+import importlib
+import logging
+import logging.handlers
+import queue
+import sys
 import structlog
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.middleware.cors import CORSMiddleware
 
-from agents.search import SearchAgent
-from agents.auth import AuthAgent
-from agents.whistle import WhistleAgent
-from agents.user import UserAgent
 from middleware.auth import AuthMiddleware
 from middleware.logging import LoggingMiddleware
 from middleware.rate_limit import RateLimitMiddleware
-from config.settings import settings
+from utils.http_client import api_client
+from config.settings import get_settings
 from dotenv import load_dotenv
 
 load_dotenv()
-# Configure structured logging for production
+
+settings = get_settings()
+
+# Fixed for the lifetime of the process (Settings is frozen)
+_ENV = settings.ENVIRONMENT
+
+# Processors shared by structlog calls and plain stdlib records (uvicorn,
+# mcp, httpx, ...) so every line carries the same fields
+_shared_processors = [
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+]
+
+# Hand log records to a background thread so stdout writes never block the
+# event loop; the QueueHandler renders, the listener thread does the I/O
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+stdout_handler = logging.StreamHandler(sys.stdout)
+log_listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+    foreign_pre_chain=_shared_processors,
+    processors=[
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+        # ConsoleRenderer prints tracebacks itself; JSON needs them as text
+        *([structlog.processors.format_exc_info, structlog.processors.JSONRenderer()]
+          if _ENV == "production" else [structlog.dev.ConsoleRenderer()]),
+    ],
+))
+root_logger = logging.getLogger()
+root_logger.addHandler(queue_handler)
+root_logger.setLevel(settings.LOG_LEVEL)
+# uvicorn configures its loggers before importing this module, with their
+# own plain-text stdout handlers and propagate=False; route them through
+# the queue so they are rendered like everything else. A logger uvicorn
+# left without handlers is disabled (--no-access-log) and stays that way.
+for _name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+    _uvicorn_logger = logging.getLogger(_name)
+    if _uvicorn_logger.handlers:
+        _uvicorn_logger.handlers.clear()
+        _uvicorn_logger.propagate = True
+# httpx/httpcore log every request (and connection event) at INFO/DEBUG and
+# mcp logs every request it processes; api_client and LoggingMiddleware
+# already cover those
+for _noisy in ("httpx", "httpcore", "mcp"):
+    logging.getLogger(_noisy).setLevel(logging.WARNING)
+log_listener.start()
+
+# Configure structured logging; rendering happens in the formatter above
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer() if settings.ENVIRONMENT == "production" 
-        else structlog.dev.ConsoleRenderer(),
+        *_shared_processors,
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
     ],
-    wrapper_class=structlog.stdlib.BoundLogger,
+    # Calls below LOG_LEVEL return immediately, before any processor runs
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelNamesMapping()[settings.LOG_LEVEL]
+    ),
     logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
 
+
+def _stop_log_listener() -> None:
+    """Flush queued records and log synchronously for the rest of shutdown"""
+    log_listener.stop()
+    # Nothing drains the queue any more, so write straight to stdout
+    stdout_handler.setFormatter(queue_handler.formatter)
+    root_logger.removeHandler(queue_handler)
+    root_logger.addHandler(stdout_handler)
+
+# Probe responses never change, so they are encoded once at import
+_HEALTH_BODY = JSONResponse({
+    "status": "healthy",
+    "service": "whistle-mcp-server",
+    "environment": _ENV,
+    "version": "1.0.0",
+    "middleware": ["logging", "rate_limit", "auth"]
+}).body
+_METRICS_BODY = JSONResponse({
+    "status": "ok",
+    "message": "Metrics endpoint ready for monitoring integration"
+}).body
+
+# ENABLED_AGENTS name -> (module, class) of each toolset
+AGENT_MODULES = {
+    "search": ("agents.search", "SearchAgent"),
+    "auth": ("agents.auth", "AuthAgent"),
+    "whistle": ("agents.whistle", "WhistleAgent"),
+    "user": ("agents.user", "UserAgent"),
+}
+
 def create_app():
     """Create and configure production-grade MCP server"""
-    
+
+    settings.log_startup()
+
     mcp = FastMCP("Whistle MCP Server")
     
     # Add middleware in correct order (first added = outermost layer)
@@ -42,36 +124,49 @@ def create_app():
     mcp.add_middleware(RateLimitMiddleware())  # Rate limit before processing
     mcp.add_middleware(AuthMiddleware())      # Check auth before execution
     
-    # Register all agents
-    SearchAgent(mcp)
-    AuthAgent(mcp)
-    WhistleAgent(mcp)
-    UserAgent(mcp)
+    # Register the enabled agents; modules are imported here, and only for
+    # enabled toolsets, so disabled ones (and the OpenAI client stack behind
+    # the whistle agent) are never loaded
+    for name in settings.enabled_agents - AGENT_MODULES.keys():
+        logger.warning("Unknown agent in ENABLED_AGENTS", agent=name)
+
+    agents_count = 0
+    for name, (module_path, class_name) in AGENT_MODULES.items():
+        if name in settings.enabled_agents:
+            getattr(importlib.import_module(module_path), class_name)(mcp)
+            agents_count += 1
     
     # Health check endpoint
     @mcp.custom_route("/health", methods=["GET"])
     async def health_check(request):
-        return JSONResponse({
-            "status": "healthy",
-            "service": "whistle-mcp-server",
-            "environment": settings.ENVIRONMENT,
-            "version": "1.0.0",
-            "middleware": ["logging", "rate_limit", "auth"]
-        })
+        return Response(_HEALTH_BODY, media_type="application/json")
     
     # Metrics endpoint for monitoring
     @mcp.custom_route("/metrics", methods=["GET"])
     async def metrics(request):
-        return JSONResponse({
-            "status": "ok",
-            "message": "Metrics endpoint ready for monitoring integration"
-        })
+        return Response(_METRICS_BODY, media_type="application/json")
     
     # Get the ASGI app
     app = mcp.http_app(stateless_http=True)
+
+    # Close pooled backend connections when the server shuts down
+    mcp_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        try:
+            async with mcp_lifespan(app):
+                yield
+        finally:
+            try:
+                await api_client.aclose()
+            finally:
+                _stop_log_listener()
+
+    app.router.lifespan_context = lifespan
     
     # Add CORS middleware for development
-    if settings.ENVIRONMENT == "development":
+    if _ENV == "development":
         app.add_middleware(
             CORSMiddleware,
             allow_origins=["*"],
@@ -82,9 +177,9 @@ def create_app():
     
     logger.info(
         "Production MCP server created",
-        environment=settings.ENVIRONMENT,
+        environment=_ENV,
         middleware_count=3,
-        agents_count=4
+        agents_count=agents_count
     )
     
     return app
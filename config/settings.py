@@ -1,11 +1,16 @@
-import os
+from functools import cached_property, lru_cache
 from typing import Optional, Literal
+import structlog
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    # Frozen: configuration is read once at startup and never mutated, which
+    # also makes the cached_property values below safe to keep
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", frozen=True
+    )
 
     # Environment Configuration
     ENVIRONMENT: Literal["development", "staging", "production"] = Field(
@@ -20,7 +25,8 @@ class Settings(BaseSettings):
     # API Configuration
     EXPRESS_API_BASE_URL: str = Field(default="https://dowhistle.herokuapp.com/v3")
     
-    # New field for PORT (from environment)
+    # PORT from the environment (Render.com injects it); environment
+    # variables take precedence over .env in pydantic-settings
     PORT: Optional[int] = Field(default=None)
 
     # Authentication
@@ -40,6 +46,21 @@ class Settings(BaseSettings):
     CONNECTION_TIMEOUT: int = Field(default=30)
     REQUEST_TIMEOUT: int = Field(default=30)
 
+    # Caching
+    PROFILE_CACHE_TTL: float = Field(default=30.0)
+    PROFILE_CACHE_SIZE: int = Field(default=1024)
+    SEARCH_CACHE_TTL: float = Field(default=15.0)
+    SEARCH_CACHE_SIZE: int = Field(default=512)
+
+    # Window in which an identical create_whistle call reuses the first result
+    CREATE_DEDUP_TTL: float = Field(default=10.0)
+
+    # Skip pydantic validation of trusted backend payloads unless enabled
+    VALIDATE_API_RESPONSES: bool = Field(default=False)
+
+    # Comma-separated toolsets to register: search, auth, whistle, user
+    ENABLED_AGENTS: str = Field(default="search,auth,whistle,user")
+
     # CORS Configuration (for HTTP transport)
     CORS_ORIGINS: str = Field(default="*")
     CORS_METHODS: str = Field(default="GET,POST,OPTIONS")
@@ -61,26 +82,25 @@ class Settings(BaseSettings):
         else:
             return "DEBUG"
 
-    @field_validator("PORT", mode="before")
-    @classmethod
-    def handle_render_port(cls, v, info):
-        """Handle Render.com PORT environment variable"""
-        render_port = os.getenv("PORT")
-        if render_port:
-            return int(render_port)
-        return v
-
-    @property
+
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode"""
         return self.ENVIRONMENT == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode"""
         return self.ENVIRONMENT == "production"
 
-    @property
+    @cached_property
+    def enabled_agents(self) -> frozenset:
+        """Parsed ENABLED_AGENTS names"""
+        return frozenset(
+            name.strip().lower() for name in self.ENABLED_AGENTS.split(",") if name.strip()
+        )
+
+    @cached_property
     def server_info(self) -> dict:
         """Get server configuration info"""
         return {
@@ -91,14 +111,15 @@ class Settings(BaseSettings):
             "log_level": self.LOG_LEVEL,
         }
 
-    def model_post_init(self, __context) -> None:
-        """Post-initialization validation and logging"""
-        print("🚀 Server Configuration:")
-        print(f"   Environment: {self.ENVIRONMENT}")
-        print(f"   Transport: {self.TRANSPORT_MODE}")
-        print(f"   MCP Port: {self.PORT}")
-        print(f"   API Base URL: {self.EXPRESS_API_BASE_URL}")
-        print(f"   Log Level: {self.LOG_LEVEL}")
+    def log_startup(self) -> None:
+        """Log the server configuration once at server start"""
+        structlog.get_logger().info("Server configuration", **self.server_info)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings; .env and validators are processed only once"""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
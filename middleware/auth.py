@@ -12,17 +12,19 @@ class AuthMiddleware(Middleware):
     """Authorization middleware for protected tools"""
     
     # Define which tools require authentication
-    PROTECTED_TOOLS = {
+    PROTECTED_TOOLS = frozenset({
         'toggle_visibility',
         'get_user_profile', 
         'create_whistle',
+        'create_whistles_bulk',
         'list_whistles'
-    }
+    })
     
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         """Check authentication for protected tools"""
         
-        tool_name = context.message.name
+        message = context.message
+        tool_name = message.name
         
         # Skip auth for public tools
         if tool_name not in self.PROTECTED_TOOLS:
@@ -48,21 +50,21 @@ class AuthMiddleware(Middleware):
 
         # Fallback to tool arguments
         if not access_token:
-            arg_token = context.message.arguments.get('access_token')
+            arg_token = message.arguments.get('access_token')
             if isinstance(arg_token, str) and arg_token.strip():
                 access_token = arg_token.strip()
 
         # Enforce auth presence and validate token format
         if not access_token or not access_token.lower().startswith('bearer '):
-            logger.warning(f"Protected tool accessed without valid token: {tool_name} (token: {access_token})")
+            logger.warning("Protected tool accessed without valid token", tool=tool_name)
             raise ToolError(PROTECTED_TOOL_ERRORS_MESSAGE)
 
         # Inject discovered values into arguments so downstream tools can rely on them
         # (Only set if not already present to avoid overwriting explicit args)
-        context.message.arguments.setdefault('access_token', access_token)
-        if user_id and 'user_id' not in context.message.arguments:
-            context.message.arguments['user_id'] = user_id
+        message.arguments.setdefault('access_token', access_token)
+        if user_id and 'user_id' not in message.arguments:
+            message.arguments['user_id'] = user_id
 
         # Token exists, let backend validate it
-        logger.info(f"Token provided for protected tool: {tool_name}")
+        logger.info("Token provided for protected tool", tool=tool_name)
         return await call_next(context)
\ No newline at end of file
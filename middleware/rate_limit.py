@@ -22,6 +22,7 @@ class RateLimitMiddleware(Middleware):
             'verify_otp': 10,        # 10 OTP verifications per minute
             'resend_otp': 3,         # 3 resend requests per minute
             'create_whistle': 20,    # 20 whistles per minute
+            'create_whistles_bulk': 2,  # 2 bulk requests (up to 20 whistles each) per minute
             'toggle_visibility': 10,  # 10 visibility toggles per minute
             'get_user_profile': 60,  # 60 profile requests per minute
             'list_whistles': 60      # 60 whistle list requests per minute
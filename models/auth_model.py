@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict, computed_field
-from typing import Optional, List
+from functools import cached_property
+from typing import Annotated, Optional, List
 
 
 # -------------------------
@@ -9,18 +10,26 @@ class Parent(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
 
+# Shared coordinate constraints, reusable by any model that takes a location
+Latitude = Annotated[float, Field(ge=-90, le=90, description="Latitude coordinate (-90 to 90)")]
+Longitude = Annotated[float, Field(ge=-180, le=180, description="Longitude coordinate (-180 to 180)")]
+
+
 # -------------------------
 # Sign In
 # -------------------------
 class SignInRequest(Parent):
+    # Frozen so location_array can be computed once and reused
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     phone: str = Field(..., description="Digits only, without country code")
     countryCode: str = Field(..., alias="countryCode", description="Country code starting with +")
     name: str
-    latitude: float = Field(..., ge=-90, le=90, description="Latitude coordinate (-90 to 90)")
-    longitude: float = Field(..., ge=-180, le=180, description="Longitude coordinate (-180 to 180)")
+    latitude: Latitude
+    longitude: Longitude
 
     @computed_field(alias="location", return_type=List[float])
-    @property
+    @cached_property
     def location_array(self) -> List[float]:
         return [self.latitude, self.longitude]
 
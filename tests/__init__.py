@@ -0,0 +1,40 @@
+import os
+
+# Settings requires an OpenAI key at import; tests never call OpenAI
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+import json
+import unittest
+from typing import Any, Dict, Tuple
+from unittest.mock import AsyncMock, patch
+
+from fastmcp import Client, FastMCP
+
+from utils.http_client import api_client
+
+
+class AgentToolTestCase(unittest.IsolatedAsyncioTestCase):
+    """Registers ``agent`` on a fresh FastMCP server and calls its tools
+    through an in-memory client with the backend API mocked out."""
+
+    agent: type
+
+    async def asyncSetUp(self):
+        mcp = FastMCP("test")
+        self.agent(mcp)
+        self.client = Client(mcp)
+        await self.client.__aenter__()
+
+    async def asyncTearDown(self):
+        await self.client.__aexit__(None, None, None)
+
+    async def call_tool(
+        self, name: str, arguments: Dict[str, Any], response: Any
+    ) -> Tuple[Dict[str, Any], AsyncMock]:
+        """Call ``name`` with ``api_client.request`` returning ``response``.
+
+        Returns the decoded tool result and the request mock.
+        """
+        with patch.object(api_client, "request", AsyncMock(return_value=response)) as request:
+            result = await self.client.call_tool(name, arguments, raise_on_error=False)
+        return json.loads(result.content[0].text), request
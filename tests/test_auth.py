@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+
+from agents import auth
+from agents.auth import AuthAgent
+from tests import AgentToolTestCase
+
+SIGN_IN_OK = {"message": "ok", "user": {"id": "u1", "_id": "u1", "otp": "123456"}, "success": True}
+
+
+class SignInPhoneTest(AgentToolTestCase):
+    agent = AuthAgent
+
+    async def _sign_in(self, phone: str):
+        return await self.call_tool("sign_in", {
+            "phone": phone, "country_code": "91", "name": "n",
+            "latitude": 12.9, "longitude": 77.6,
+        }, SIGN_IN_OK)
+
+    async def _assert_sent_phone(self, phone: str, expected: str):
+        body, request = await self._sign_in(phone)
+        self.assertTrue(body["success"], body)
+        self.assertEqual(request.await_args.kwargs["data"]["phone"], expected)
+
+    async def test_separators_are_stripped(self):
+        await self._assert_sent_phone("(98765) 432-10", "9876543210")
+
+    async def test_no_break_space_is_stripped(self):
+        await self._assert_sent_phone("98765\xa043210", "9876543210")
+
+    async def test_narrow_no_break_space_is_stripped(self):
+        await self._assert_sent_phone("98765\u202f43210", "9876543210")
+
+    async def test_letters_are_rejected(self):
+        body, request = await self._sign_in("98765abc")
+        self.assertFalse(body["success"])
+        request.assert_not_awaited()
+
+
+class OtpBucketTest(unittest.TestCase):
+    def setUp(self):
+        auth._otp_buckets.clear()
+
+    def test_fourth_attempt_within_a_minute_is_rejected(self):
+        for _ in range(3):
+            auth._consume_otp_token("verify_otp", "u1")
+        with self.assertRaisesRegex(ValueError, "Too many OTP attempts"):
+            auth._consume_otp_token("verify_otp", "u1")
+        # Other users and tools have their own buckets
+        auth._consume_otp_token("resend_otp", "u1")
+        auth._consume_otp_token("verify_otp", "u2")
+
+    def test_bucket_count_is_capped(self):
+        with patch.object(auth._otp_buckets, "maxsize", 5):
+            for i in range(20):
+                auth._consume_otp_token("verify_otp", f"u{i}")
+            self.assertEqual(len(auth._otp_buckets._data), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
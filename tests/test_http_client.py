@@ -0,0 +1,58 @@
+import unittest
+
+import httpx
+
+from utils.http_client import APIClient, _retry_after_seconds
+
+
+def _status_error(retry_after: str) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.test/user")
+    response = httpx.Response(429, headers={"Retry-After": retry_after}, request=request)
+    return httpx.HTTPStatusError("429", request=request, response=response)
+
+
+class RetryAfterTest(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(_retry_after_seconds(_status_error("7")), 7.0)
+
+    def test_http_date_in_the_past(self):
+        self.assertEqual(
+            _retry_after_seconds(_status_error("Wed, 21 Oct 2015 07:28:00 GMT")), 0.0
+        )
+
+    def test_naive_minus_zero_zone_date(self):
+        # parsedate_to_datetime returns a naive datetime for "-0000"
+        self.assertEqual(
+            _retry_after_seconds(_status_error("Wed, 21 Oct 2015 07:28:00 -0000")), 0.0
+        )
+
+    def test_unparseable_value_falls_back(self):
+        self.assertIsNone(_retry_after_seconds(_status_error("soon")))
+
+
+class GetIfChangedTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.seen = []
+        self.api = APIClient()
+        self.api._client = httpx.AsyncClient(
+            base_url=self.api.base_url, transport=httpx.MockTransport(self._handle)
+        )
+        self.addAsyncCleanup(self.api.aclose)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"user": {}}, headers={"ETag": '"v1"'})
+
+    async def test_unconditional_get_returns_body_and_etag(self):
+        self.assertEqual(await self.api.get_if_changed("/user"), ({"user": {}}, '"v1"'))
+        self.assertEqual(self.seen, [None])
+
+    async def test_not_modified_returns_no_body(self):
+        self.assertEqual(await self.api.get_if_changed("/user", etag='"v1"'), (None, '"v1"'))
+        self.assertEqual(self.seen, ['"v1"'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from agents import search
+from agents.search import SearchAgent
+from tests import AgentToolTestCase
+
+INT_RESULT = {"providers": [
+    {"item": {"_id": "m1", "name": "Matched", "countryCode": "+91", "phone": "1",
+              "location": {"address": "a", "coordinates": [77, 12]}, "dis": 3}},
+    {"_id": "d1", "name": "Direct", "countryCode": "+91", "phone": "2",
+     "address": "b", "distance": 4, "lat": 13, "lng": 78},
+]}
+
+
+class SearchBusinessesTest(AgentToolTestCase):
+    agent = SearchAgent
+
+    async def asyncSetUp(self):
+        search._search_cache.clear()
+        await super().asyncSetUp()
+
+    async def _search(self, response):
+        body, _ = await self.call_tool(
+            "search_businesses", {"latitude": 12.0, "longitude": 77.0, "keyword": "x"}, response
+        )
+        return body["providers"]
+
+    async def test_integer_coordinates_serialize_as_floats(self):
+        matched, direct = await self._search(INT_RESULT)
+
+        self.assertEqual(matched["id"], "m1")
+        self.assertEqual(direct["id"], "d1")
+        for provider in (matched, direct):
+            for key in ("distance", "latitude", "longitude"):
+                self.assertIsInstance(provider[key], float, key)
+        self.assertEqual((direct["latitude"], direct["longitude"]), (13.0, 78.0))
+
+    async def test_each_record_uses_its_own_shape(self):
+        direct, matched = await self._search({"providers": INT_RESULT["providers"][::-1]})
+
+        self.assertEqual((direct["id"], direct["name"]), ("d1", "Direct"))
+        self.assertEqual((matched["id"], matched["address"]), ("m1", "a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from agents import user
+from agents.user import UserAgent
+from tests import AgentToolTestCase
+from utils.http_client import api_client
+
+USER = {"_id": "u1", "name": "n", "phone": "1", "countryCode": "+91", "visible": True}
+
+
+class GetUserProfileTest(AgentToolTestCase):
+    agent = UserAgent
+
+    async def asyncSetUp(self):
+        user._profile_cache.clear()
+        user._profile_generation.clear()
+        await super().asyncSetUp()
+
+    async def _get_profile(self, payload):
+        return await self.call_tool("get_user_profile", {"access_token": "Bearer t"}, payload)
+
+    async def test_profile_is_returned_and_cached(self):
+        body, _ = await self._get_profile({"user": USER})
+        self.assertTrue(body["success"])
+        self.assertEqual(body["data"]["_id"], "u1")
+
+        _, request = await self._get_profile({"user": USER})
+        request.assert_not_awaited()
+
+    async def test_missing_required_field_fails_and_is_not_cached(self):
+        broken = {k: v for k, v in USER.items() if k != "phone"}
+        body, _ = await self._get_profile({"user": broken})
+        self.assertFalse(body["success"])
+
+        _, request = await self._get_profile({"user": broken})
+        request.assert_awaited_once()
+
+    async def test_wrong_type_fails(self):
+        body, _ = await self._get_profile({"user": {**USER, "countryCode": 91}})
+        self.assertFalse(body["success"])
+
+    async def test_toggle_during_slow_get_is_not_overwritten(self):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def backend(method, endpoint, **kwargs):
+            if method == "PUT":
+                return {"user": {**USER, "visible": False}}
+            started.set()
+            await release.wait()
+            return {"user": USER}
+
+        with patch.object(api_client, "request", AsyncMock(side_effect=backend)):
+            slow_get = asyncio.create_task(
+                self.client.call_tool("get_user_profile", {"access_token": "Bearer t"})
+            )
+            await started.wait()
+            await self.client.call_tool(
+                "toggle_visibility", {"access_token": "Bearer t", "visible": "false"}
+            )
+            release.set()
+            await slow_get
+
+        body, request = await self._get_profile({"user": USER})
+        request.assert_not_awaited()
+        self.assertFalse(body["data"]["visible"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import asyncio
+import itertools
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+from fastmcp import FastMCP
+
+from agents import whistle
+from agents.whistle import AdvancedLLMExtractor, ExtractedWhistleData, WhistleAgent
+from utils.http_client import api_client
+
+
+async def _extract(self, user_input):
+    return ExtractedWhistleData(
+        description=user_input, tags=["plumbing"], provider=False, confidence_score=0.9
+    )
+
+
+class CreateWhistlesBulkTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        whistle._recent_creates.clear()
+        ids = itertools.count(1)
+
+        async def create(method, endpoint, data=None, **kwargs):
+            return {"newWhistle": {"_id": f"w{next(ids)}", **data["whistle"]}}
+
+        self.request = AsyncMock(side_effect=create)
+        patches = [
+            patch.object(api_client, "request", self.request),
+            patch.object(AdvancedLLMExtractor, "extract_attributes", _extract),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.agent = WhistleAgent(FastMCP("test"))
+
+    async def test_identical_inputs_are_created_once(self):
+        result = await self.agent.create_whistles_bulk(
+            ["need a plumber today", "need an electrician", "need a plumber today"],
+            access_token="Bearer t"
+        )
+
+        self.assertEqual(self.request.await_count, 2)
+        self.assertEqual(result["created_count"], 2)
+        self.assertEqual(result["duplicate_count"], 1)
+        self.assertEqual(result["failed_count"], 0)
+        self.assertEqual(
+            [r["status"] for r in result["results"]], ["success", "success", "duplicate"]
+        )
+        self.assertEqual(result["results"][2]["duplicate_of"], 0)
+
+    async def test_retried_create_whistle_reuses_the_first_result(self):
+        first = await self.agent.create_whistle("need a plumber today", "Bearer t")
+        again = await self.agent.create_whistle("need a plumber today", "Bearer t")
+
+        self.assertEqual(self.request.await_count, 1)
+        self.assertEqual(first["whistle"]["id"], again["whistle"]["id"])
+
+
+class ListWhistlesTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        whistle._user_cache.clear()
+        whistle._user_validators.clear()
+        whistle._user_inflight.clear()
+        whistle._user_generation.clear()
+        whistle._recent_creates.clear()
+        self.agent = WhistleAgent(FastMCP("test"))
+
+    async def test_failure_reports_listing_error(self):
+        get = AsyncMock(side_effect=RuntimeError("boom"))
+        with patch.object(api_client, "get_if_changed", get):
+            result = await self.agent.list_whistles(access_token="Bearer t")
+
+        get.assert_awaited_once()
+        self.assertEqual(result["status"], "error")
+        self.assertIn("listing whistles", result["message"])
+        self.assertEqual(list(result["whistles"]), [])
+
+    async def test_create_during_slow_get_is_not_hidden(self):
+        before = {"user": {"Whistles": []}}
+        after = {"user": {"Whistles": [{"_id": "w1", "description": "d"}]}}
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def get(endpoint, etag=None, headers=None):
+            if not started.is_set():
+                started.set()
+                await release.wait()
+                return before, None
+            return after, None
+
+        async def create(method, endpoint, data=None, **kwargs):
+            return {"newWhistle": {"_id": "w1", **data["whistle"]}}
+
+        get_mock = AsyncMock(side_effect=get)
+        with patch.object(api_client, "get_if_changed", get_mock), \
+                patch.object(api_client, "request", AsyncMock(side_effect=create)), \
+                patch.object(AdvancedLLMExtractor, "extract_attributes", _extract):
+            stale = asyncio.create_task(self.agent.list_whistles(access_token="Bearer t"))
+            await started.wait()
+            await self.agent.create_whistle("need a plumber today", "Bearer t")
+            # Issued after the create, so it must not join the older GET
+            fresh = asyncio.create_task(self.agent.list_whistles(access_token="Bearer t"))
+            await asyncio.sleep(0)
+            release.set()
+            await stale
+            fresh = await fresh
+            later = await self.agent.list_whistles(access_token="Bearer t")
+
+        self.assertEqual([w["id"] for w in fresh["whistles"]], ["w1"])
+        self.assertEqual([w["id"] for w in later["whistles"]], ["w1"])
+        self.assertEqual(get_mock.await_count, 2)
+
+
+class ListWhistlesPagingTest(unittest.IsolatedAsyncioTestCase):
+    # w0..w5, with every third whistle inactive
+    USER = {"user": {"Whistles": [
+        {"_id": f"w{i}", "active": i % 3 != 2} for i in range(6)
+    ]}}
+
+    def setUp(self):
+        whistle._user_cache.clear()
+        patcher = patch.object(
+            api_client, "get_if_changed", AsyncMock(return_value=(self.USER, None))
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.agent = WhistleAgent(FastMCP("test"))
+
+    async def _page(self, **kwargs):
+        result = await self.agent.list_whistles(access_token="Bearer t", **kwargs)
+        return [w["id"] for w in result["whistles"]], result["total_count"], result["has_more"]
+
+    async def test_pages_walk_the_whole_list(self):
+        self.assertEqual(await self._page(limit=4), (["w0", "w1", "w2", "w3"], 6, True))
+        self.assertEqual(await self._page(limit=4, offset=4), (["w4", "w5"], 6, False))
+
+    async def test_has_more_is_false_on_an_exact_last_page(self):
+        self.assertEqual(await self._page(limit=3, offset=3), (["w3", "w4", "w5"], 6, False))
+        self.assertEqual(await self._page(limit=3, offset=6), ([], 6, False))
+
+    async def test_active_only_counts_and_pages_the_filtered_list(self):
+        self.assertEqual(await self._page(active_only=True, limit=2), (["w0", "w1"], 4, True))
+        self.assertEqual(
+            await self._page(active_only=True, limit=2, offset=2), (["w3", "w4"], 4, False)
+        )
+
+    async def test_default_limit_truncates_to_fifty(self):
+        many = {"user": {"Whistles": [{"_id": f"w{i}"} for i in range(60)]}}
+        api_client.get_if_changed.return_value = (many, None)
+        ids, total, has_more = await self._page()
+        self.assertEqual((len(ids), total, has_more), (50, 60, True))
+
+
+class FetchUserTest(unittest.IsolatedAsyncioTestCase):
+    """The conditional, single-flight GET /user behind list_whistles"""
+
+    async def asyncSetUp(self):
+        whistle._user_cache.clear()
+        whistle._user_validators.clear()
+        whistle._user_inflight.clear()
+        whistle._user_generation.clear()
+        self.responses = []
+        self.seen = []
+        client = httpx.AsyncClient(
+            base_url=api_client.base_url, transport=httpx.MockTransport(self._handle)
+        )
+        self.addAsyncCleanup(client.aclose)
+        patcher = patch.object(api_client, "_client", client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.seen.append(request.headers.get("If-None-Match"))
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+    async def _fetch_expired(self):
+        # Force a trip to the backend as if the short TTL had elapsed
+        whistle._user_cache.clear()
+        return await whistle._fetch_user("Bearer t")
+
+    async def test_not_modified_reuses_the_stored_body(self):
+        self.responses = [
+            httpx.Response(200, json={"user": {"name": "a"}}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+        first = await self._fetch_expired()
+        second = await self._fetch_expired()
+
+        self.assertEqual(self.seen, [None, '"v1"'])
+        self.assertEqual(second, first)
+
+    async def test_response_without_etag_drops_the_validator(self):
+        self.responses = [
+            httpx.Response(200, json={"user": {"name": "a"}}, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json={"user": {"name": "b"}}),
+            httpx.Response(200, json={"user": {"name": "c"}}),
+        ]
+        await self._fetch_expired()
+        await self._fetch_expired()
+        third = await self._fetch_expired()
+
+        self.assertEqual(self.seen, [None, '"v1"', None])
+        self.assertEqual(third["user"]["name"], "c")
+
+    async def test_concurrent_misses_share_one_request(self):
+        self.responses = [httpx.Response(200, json={"user": {"name": "a"}})]
+        results = await asyncio.gather(*(whistle._fetch_user("Bearer t") for _ in range(3)))
+
+        self.assertEqual(len(self.seen), 1)
+        self.assertEqual(results, [{"user": {"name": "a"}}] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,65 @@
+import random
 import httpx
 import structlog
-from typing import Dict, Any, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt
 from config.settings import settings
 
 logger = structlog.get_logger()
 
+# Transient backend responses worth retrying; other 4xx are returned immediately
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_RETRY_DELAY = 30.0
+RETRY_JITTER = 0.5
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry on network/timeout failures and throttling or gateway errors"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) from a failed response"""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+        # "-0000" dates come back naive; HTTP dates are always UTC
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Exponential backoff with jitter, honoring Retry-After when present"""
+    retry_after = _retry_after_seconds(retry_state.outcome.exception())
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_DELAY)
+
+    attempt = retry_state.attempt_number - 1
+    delay = settings.RETRY_DELAY * 2**attempt * (1 + random.random() * RETRY_JITTER)
+    return min(delay, MAX_RETRY_DELAY)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    logger.warning(
+        "Retrying API request",
+        attempt=retry_state.attempt_number,
+        wait_seconds=round(retry_state.next_action.sleep, 2),
+        error=str(retry_state.outcome.exception()),
+    )
+
 
 class APIClient:
     def __init__(self):
@@ -16,6 +70,34 @@ class APIClient:
         }
         if settings.API_KEY:
             self.headers["Authorization"] = f"Bearer {settings.API_KEY}"
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared connection-pooled client, created lazily on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                # Retries are handled by the tenacity policy on request()
+                transport=httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=100,
+                        max_connections=200,
+                        keepalive_expiry=30.0,
+                    ),
+                    retries=0,
+                ),
+                timeout=httpx.Timeout(
+                    settings.REQUEST_TIMEOUT, connect=settings.CONNECTION_TIMEOUT
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client and release pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def get_base_url_for_endpoint(self, endpoint: str) -> str:
         """Get appropriate base URL based on endpoint and environment"""
@@ -33,69 +115,115 @@ class APIClient:
             return self.base_url
 
     @retry(
+        retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(settings.MAX_RETRIES),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_retry_wait,
+        before_sleep=_log_retry,
+        reraise=True,
     )
-    async def request(
+    async def _send(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
-        """Make HTTP request to Express API with retry logic"""
+        content: Optional[bytes] = None,
+        allow_not_modified: bool = False,
+    ) -> httpx.Response:
+        """Send a request with retry logic; 304 is only accepted for conditional GETs"""
 
         request_headers = {**self.headers, **(headers or {})}
         base_url = self.get_base_url_for_endpoint(endpoint)
-        url = f"{base_url}/{endpoint.lstrip('/')}"
+        # Relative URLs resolve against the client's pinned base_url
+        url = (
+            endpoint
+            if base_url == self.base_url
+            else f"{base_url}/{endpoint.lstrip('/')}"
+        )
 
         logger.info(
             "Making API request",
             method=method,
-            url=url,
+            endpoint=endpoint,
             base_url=base_url,
-            has_data=data is not None,
+            has_data=data is not None or content is not None,
         )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    params=params,
-                    headers=request_headers,
-                )
+        try:
+            response = await self.client.request(
+                method=method,
+                url=url,
+                json=data if content is None else None,
+                content=content,
+                params=params,
+                headers=request_headers,
+            )
+            if not (allow_not_modified and response.status_code == 304):
                 response.raise_for_status()
 
-                result = response.json()
-                logger.info(
-                    "API request successful",
-                    status_code=response.status_code,
-                    endpoint=endpoint,
-                    base_url=base_url,
-                )
-                return result
-
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "API request failed",
-                    status_code=e.response.status_code,
-                    error=str(e),
-                    endpoint=endpoint,
-                    base_url=base_url,
-                    response_text=e.response.text,
-                )
-                raise
-            except Exception as e:
-                logger.error(
-                    "API request error",
-                    error=str(e),
-                    endpoint=endpoint,
-                    base_url=base_url,
-                )
-                raise
+            logger.info(
+                "API request successful",
+                status_code=response.status_code,
+                endpoint=endpoint,
+                base_url=base_url,
+            )
+            return response
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "API request failed",
+                status_code=e.response.status_code,
+                error=str(e),
+                endpoint=endpoint,
+                base_url=base_url,
+                response_text=e.response.text,
+            )
+            raise
+        except Exception as e:
+            logger.error(
+                "API request error",
+                error=str(e),
+                endpoint=endpoint,
+                base_url=base_url,
+            )
+            raise
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to Express API with retry logic.
+        `content` sends a pre-encoded JSON body as-is instead of encoding `data`.
+        """
+        response = await self._send(method, endpoint, data, params, headers, content)
+        return response.json()
+
+    async def get_if_changed(
+        self,
+        endpoint: str,
+        etag: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Conditional GET using If-None-Match.
+        Returns (None, etag) when the backend answers 304 Not Modified,
+        otherwise the decoded body and the response's ETag (if any).
+        """
+        if etag:
+            headers = {**(headers or {}), "If-None-Match": etag}
+        response = await self._send(
+            "GET", endpoint, headers=headers, allow_not_modified=True
+        )
+        if response.status_code == 304:
+            return None, etag
+        return response.json(), response.headers.get("ETag")
 
 
 # Global client instance